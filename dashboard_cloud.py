@@ -3,11 +3,26 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
+import pyarrow.parquet as pq
 import json
 import os
 
 PLOTS_PATH = "plots"
+SHAP_TOP_K = 12  # bars drawn in the SHAP chart; keeps height and render cost bounded
+DATA_PATH = "predictions.parquet"
+CSV_PATH = "predictions.csv"
+
+# Columns the dashboard reads; everything else in the predictions file is skipped
+COLUMNS = [
+    'building_id', 'building_type', 'cluster', 'avg_consumption', 'baseload',
+    'weekend_ratio', 'is_anomaly', 'underperformer', 'priority_rank',
+    'recommendation', 'shap_json'
+]
+
+# Columns shown in the Top Priority table, plus the extra fields the Deep Dive needs
+PRIORITY_COLUMNS = ['building_id', 'building_type', 'recommendation', 'priority_rank']
+DEEP_DIVE_COLUMNS = ['cluster', 'avg_consumption', 'baseload', 'weekend_ratio']
 
 st.set_page_config(
     page_title="Building Energy Insights", 
@@ -40,103 +55,327 @@ st.markdown("""
 # Load Data Directly (no API)
 # -----------------------------------------------------------------------------
 
-@st.cache(ttl=300, allow_output_mutation=True)
-def load_data():
+def parse_shap(raw):
+    """Decode one SHAP JSON blob, falling back to an empty dict"""
+    if not isinstance(raw, str) or not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return {}
+
+def data_version():
+    """Modification time of the data file, the cache key for the data and every view derived from it"""
+    for path in (DATA_PATH, CSV_PATH):
+        if os.path.exists(path):
+            return os.path.getmtime(path)
+    return None
+
+# Keyed on the data version so a changed file is reloaded together with every
+# derived view; only the current version's frame is kept in memory, and the
+# version-keyed views below use max_entries=1 for the same reason
+@st.cache_resource(max_entries=1)
+def load_data(version):
     try:
-        df = pd.read_parquet("predictions.parquet")
-        return df
+        available = set(pq.read_schema(DATA_PATH).names)
+        df = pd.read_parquet(
+            DATA_PATH,
+            engine="pyarrow",
+            columns=[c for c in COLUMNS if c in available],
+            memory_map=True
+        )
     except:
         try:
-            df = pd.read_csv("predictions.csv")
-            return df
+            df = pd.read_csv(CSV_PATH, usecols=lambda c: c in COLUMNS)
         except:
             return None
+    
+    # Compact dtypes: repeated strings as categories, few clusters fit in int8.
+    # The nullable Int8 keeps rows without a cluster (possible with the CSV fallback)
+    df['building_type'] = df['building_type'].astype('category')
+    df['cluster'] = df['cluster'].astype('Int8')
+    
+    # Parse SHAP JSON once at load into a float32 matrix aligned with the rows.
+    # Feature names are shared by every building, so they are stored only once.
+    if 'shap_json' in df.columns:
+        parsed = [parse_shap(raw) for raw in df.pop('shap_json')]
+    else:
+        parsed = [{}] * len(df)
+    shap_features = np.array(list(dict.fromkeys(name for shap in parsed for name in shap)), dtype=str)
+    feature_pos = {name: j for j, name in enumerate(shap_features)}
+    shap_matrix = np.full((len(df), len(shap_features)), np.nan, dtype=np.float32)
+    for i, shap in enumerate(parsed):
+        for name, value in shap.items():
+            shap_matrix[i, feature_pos[name]] = value
+    
+    return df, shap_features, shap_matrix
 
-df = load_data()
+version = data_version()
+data = load_data(version)
 
-if df is None:
+if data is None:
     st.error("Cannot load predictions.parquet or predictions.csv")
     st.stop()
 
+df, shap_features, shap_matrix = data
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
-def get_summary():
+def top_priority(n=10):
+    """Row positions of the n smallest priority ranks: partial partition instead of a full sort"""
+    ranks = df['priority_rank'].to_numpy(dtype=float, na_value=np.nan)
+    missing = np.isnan(ranks)
+    valid = np.flatnonzero(~missing)
+    n = min(n, len(ranks))
+    k = min(n, len(valid))
+    top = np.array([], dtype=np.intp)
+    if k:
+        # Ranks can tie; keep every ranked row up to the k-th smallest rank and let a
+        # stable sort on that short list break ties by row order, like nsmallest(keep='first')
+        threshold = np.partition(ranks[valid], k - 1)[k - 1]
+        idx = valid[ranks[valid] <= threshold]
+        top = idx[np.argsort(ranks[idx], kind='stable')][:k]
+    # As in nsmallest, rows with a missing rank (possible with the CSV fallback)
+    # only fill the list, in row order, once the ranked rows run out
+    return np.concatenate([top, np.flatnonzero(missing)[:n - k]])
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def get_summary(version):
+    # Top-priority records carry the Deep Dive fields and SHAP row, so selecting
+    # one of them needs no second lookup
+    positions = top_priority(10)
+    columns = [c for c in PRIORITY_COLUMNS + DEEP_DIVE_COLUMNS if c in df.columns]
+    top = df.iloc[positions][columns].to_dict('records')
+    for record, i in zip(top, positions):
+        record['shap_values'] = shap_matrix[i]
+    
     return {
         "total_buildings": len(df),
         "anomalies": int(df['is_anomaly'].sum()),
         "underperformers": int(df['underperformer'].sum()) if 'underperformer' in df.columns else 0,
-        "clusters": df['cluster'].value_counts().to_dict(),
-        "top_priority": df.nsmallest(10, 'priority_rank')[
-            ['building_id', 'building_type', 'recommendation', 'priority_rank']
-        ].to_dict('records')
+        "clusters": df['cluster'].value_counts(dropna=True).to_dict(),
+        "top_priority": top
     }
 
-def get_building(building_id):
-    row = df[df['building_id'] == building_id]
-    if row.empty:
+@st.cache_data(ttl=300)
+def list_plots():
+    """Filenames in the plots folder from a single directory scan, None if missing"""
+    if not os.path.isdir(PLOTS_PATH):
         return None
-    record = row.iloc[0].to_dict()
-    
-    # Parse SHAP JSON
-    if 'shap_json' in record and record['shap_json'] and pd.notna(record['shap_json']):
-        try:
-            record['shap_values'] = json.loads(record['shap_json'])
-        except:
-            record['shap_values'] = {}
-    else:
-        record['shap_values'] = {}
-    
-    return record
+    return set(os.listdir(PLOTS_PATH))
 
-def get_cluster(cluster_id):
-    cluster_df = df[df['cluster'] == cluster_id]
-    if cluster_df.empty:
-        return None
+@st.cache_resource(ttl=300)
+def load_plot(filename):
+    """Read an EDA image at most once per TTL so reruns don't go back to disk"""
+    with open(f"{PLOTS_PATH}/{filename}", "rb") as f:
+        return f.read()
+
+@st.cache_data(ttl=300)
+def load_plot_stats():
+    with open(f"{PLOTS_PATH}/summary_stats.json") as f:
+        return json.load(f)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_priority_table(version):
+    """Top-priority table built once per data version; st.dataframe only reads it"""
+    return pd.DataFrame(get_summary(version)['top_priority'], columns=PRIORITY_COLUMNS)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def get_clusters(version):
+    """Aggregate stats for every cluster in a single groupby pass"""
+    grouped = df.groupby('cluster', dropna=True)
+    agg = pd.DataFrame({
+        "count": grouped.size(),
+        "avg_baseload": grouped['baseload'].mean(),
+        "avg_weekend_ratio": grouped['weekend_ratio'].mean() if 'weekend_ratio' in df.columns else None
+    })
     return {
-        "cluster_id": cluster_id,
-        "count": len(cluster_df),
-        "avg_baseload": float(cluster_df['baseload'].mean()),
-        "avg_weekend_ratio": float(cluster_df['weekend_ratio'].mean()) if 'weekend_ratio' in cluster_df.columns else None
+        cluster_id: {"cluster_id": cluster_id, **stats}
+        for cluster_id, stats in agg.to_dict('index').items()
     }
 
+def get_cluster(cluster_id, version):
+    return get_clusters(version).get(cluster_id)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def get_shap_labels(version):
+    """Display labels for every SHAP feature, aligned with shap_features"""
+    return np.char.title(np.char.replace(shap_features, '_', ' '))
+
+# One entry per top-priority building the Deep Dive can select
+@st.cache_resource(show_spinner=False, max_entries=10)
+def get_shap_chart(building_id, version, _shap_values):
+    """Build the SHAP bar chart once per building; reruns reuse the Chart.
+    
+    _shap_values is the building's row of shap_matrix; the leading underscore keeps
+    it out of the cache key, which (building_id, version) already determines.
+    """
+    # Altair renders through the Vega-Lite bundle Streamlit already ships
+    import altair as alt
+    
+    present = ~np.isnan(_shap_values)
+    labels, values = get_shap_labels(version)[present], _shap_values[present]
+    order = np.argsort(-np.abs(values), kind='stable')[:SHAP_TOP_K]
+    bars = pd.DataFrame({
+        "feature": labels[order],
+        "impact": values[order],
+        "color": np.where(values[order] > 0, '#ef4444', '#22c55e')
+    })
+    
+    return alt.Chart(bars).mark_bar().encode(
+        x=alt.X("impact:Q", title="Impact on prediction"),
+        y=alt.Y("feature:N", title=None, sort=None),
+        color=alt.Color("color:N", scale=None)
+    ).properties(
+        height=max(300, len(bars) * 35)
+    ).configure(
+        background='transparent',
+        padding={"left": 10, "right": 10, "top": 10, "bottom": 10}
+    ).configure_view(
+        strokeWidth=0
+    ).configure_axisX(
+        gridColor='#e2e8f0'
+    ).configure_axisY(
+        grid=False
+    )
+
 # -----------------------------------------------------------------------------
 # Cluster descriptions
 # -----------------------------------------------------------------------------
 
-def get_cluster_description(cluster_id, cluster_stats):
-    """Generate actionable cluster description"""
-    descriptions = {
-        "high_baseload": {
-            "name": "🔴 High Baseload (24/7 Operators)",
-            "description": "Buildings with consistently high energy use, even during off-hours.",
-            "action": "**Action:** Priority targets for energy audits and demand-side management programs."
-        },
-        "efficient": {
-            "name": "🟢 Efficient Buildings",
-            "description": "Well-managed buildings with good weekend/night shutdown patterns.",
-            "action": "**Action:** Use as benchmarks. Document best practices for other buildings."
-        },
-        "standard": {
-            "name": "🟡 Standard Operations",
-            "description": "Typical consumption patterns with some optimization potential.",
-            "action": "**Action:** Secondary priority for retro-commissioning programs."
-        }
+CLUSTER_DESCRIPTIONS = {
+    "high_baseload": {
+        "name": "🔴 High Baseload (24/7 Operators)",
+        "description": "Buildings with consistently high energy use, even during off-hours.",
+        "action": "**Action:** Priority targets for energy audits and demand-side management programs."
+    },
+    "efficient": {
+        "name": "🟢 Efficient Buildings",
+        "description": "Well-managed buildings with good weekend/night shutdown patterns.",
+        "action": "**Action:** Use as benchmarks. Document best practices for other buildings."
+    },
+    "standard": {
+        "name": "🟡 Standard Operations",
+        "description": "Typical consumption patterns with some optimization potential.",
+        "action": "**Action:** Secondary priority for retro-commissioning programs."
     }
+}
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def get_cluster_roles(version):
+    """Rank clusters by baseload once and map each cluster_id to its description key"""
+    clusters_by_baseload = sorted(get_clusters(version).items(), key=lambda x: x[1]['avg_baseload'], reverse=True)
+    last = len(clusters_by_baseload) - 1
     
-    clusters_by_baseload = sorted(cluster_stats.items(), key=lambda x: x[1]['avg_baseload'], reverse=True)
-    
+    roles = {}
     for i, (cid, stats) in enumerate(clusters_by_baseload):
-        if int(cid) == cluster_id:
-            if i == 0:
-                return descriptions["high_baseload"]
-            elif i == len(clusters_by_baseload) - 1:
-                return descriptions["efficient"]
-            else:
-                return descriptions["standard"]
-    
-    return descriptions["standard"]
+        if i == 0:
+            roles[cid] = "high_baseload"
+        elif i == last:
+            roles[cid] = "efficient"
+        else:
+            roles[cid] = "standard"
+    return roles
+
+def get_cluster_description(cluster_id, cluster_roles):
+    """Generate actionable cluster description"""
+    return CLUSTER_DESCRIPTIONS[cluster_roles.get(cluster_id, "standard")]
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def get_cluster_cards(version):
+    """One ready-to-render record per cluster card, in the summary's display order"""
+    cluster_stats = get_clusters(version)
+    cluster_roles = get_cluster_roles(version)
+    return [
+        {
+            "count": count,
+            "stats": cluster_stats.get(cluster_id, {}),
+            **get_cluster_description(cluster_id, cluster_roles)
+        }
+        for cluster_id, count in get_summary(version)['clusters'].items()
+    ]
+
+# -----------------------------------------------------------------------------
+# Building Deep Dive
+# -----------------------------------------------------------------------------
+
+@st.fragment
+def deep_dive(priority_buildings, version):
+    """Selectbox, comparison and SHAP chart; reruns on its own when the selection changes"""
+    if priority_buildings:
+        selected = st.selectbox(
+            "Select a priority building:",
+            options=range(len(priority_buildings)),
+            format_func=lambda i: f"#{priority_buildings[i]['priority_rank']} - {priority_buildings[i]['building_id']} ({priority_buildings[i]['building_type']})"
+        )
+        
+        if selected is not None:
+            building = priority_buildings[selected]
+            building_id = building['building_id']
+            
+            st.markdown("---")
+            
+            # Recommendation as the main callout
+            recommendation = building.get('recommendation', 'Conduct energy audit to identify optimization opportunities.')
+            st.success(f"**Recommendation:** {recommendation}")
+            
+            # Get cluster data for comparison
+            cluster_id = building.get('cluster')
+            cluster_data = get_cluster(cluster_id, version) if cluster_id is not None else None
+            weekend_ratio = building.get('weekend_ratio')
+            
+            # Read each field once; the metrics below reuse them
+            b_consumption = building.get('avg_consumption', 0)
+            b_baseload = building.get('baseload', 0)
+            if cluster_data:
+                c_baseload = cluster_data.get('avg_baseload', 0)
+                c_weekend_ratio = cluster_data.get('avg_weekend_ratio')
+                deltas = {
+                    "avg_consumption": f"{b_consumption - c_baseload:.1f}",
+                    "baseload": f"{b_baseload - c_baseload:.1f}",
+                    "weekend_ratio": f"{(weekend_ratio or 0) - c_weekend_ratio:.2f}" if c_weekend_ratio else None
+                }
+            
+            # Building vs Cluster Comparison
+            st.subheader("How does this building compare to its peers?")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**This Building**")
+                st.metric("Avg Consumption", f"{b_consumption:.1f} kWh")
+                st.metric("Baseload", f"{b_baseload:.1f} kWh")
+                if weekend_ratio:
+                    st.metric("Weekend Ratio", f"{weekend_ratio:.2f}")
+            
+            with col2:
+                st.write(f"**Cluster {cluster_id} Average**")
+                if cluster_data:
+                    st.metric("Avg Consumption", f"{c_baseload:.1f} kWh", delta=deltas["avg_consumption"])
+                    st.metric("Baseload", f"{c_baseload:.1f} kWh", delta=deltas["baseload"])
+                    if c_weekend_ratio:
+                        st.metric("Weekend Ratio", f"{c_weekend_ratio:.2f}", delta=deltas["weekend_ratio"])
+                else:
+                    st.write("Cluster data not available")
+            
+            # SHAP Explanation
+            shap_values = building['shap_values']
+            
+            n_features = int(np.count_nonzero(~np.isnan(shap_values)))
+            
+            if n_features:
+                st.markdown("---")
+                st.subheader("Why was this building flagged?")
+                st.caption("The chart below shows which factors contributed most to the model's prediction. Longer bars = bigger impact.")
+                
+                chart = get_shap_chart(building_id, version, shap_values)
+                st.altair_chart(chart, use_container_width=True)
+                
+                if n_features > SHAP_TOP_K:
+                    st.caption(f"Showing top {SHAP_TOP_K} of {n_features} features.")
+                st.caption("🔴 Red = pushes toward worse efficiency | 🟢 Green = pushes toward better efficiency")
 
 # -----------------------------------------------------------------------------
 # Dashboard Header
@@ -145,7 +384,7 @@ def get_cluster_description(cluster_id, cluster_stats):
 st.title("Building Energy Insights")
 st.caption("ML-Powered Energy Analysis | Azure Databricks + MLflow + Streamlit")
 
-summary = get_summary()
+summary = get_summary(version)
 
 # -----------------------------------------------------------------------------
 # Tabs
@@ -199,11 +438,12 @@ with tab1:
     # Data Overview
     st.header("📈 Data Overview")
     
-    if os.path.exists(PLOTS_PATH):
+    plot_files = list_plots()
+    
+    if plot_files is not None:
         # Summary stats
-        if os.path.exists(f"{PLOTS_PATH}/summary_stats.json"):
-            with open(f"{PLOTS_PATH}/summary_stats.json") as f:
-                stats = json.load(f)
+        if "summary_stats.json" in plot_files:
+            stats = load_plot_stats()
             
             col1, col2, col3, col4 = st.columns(4)
             col1.metric("Buildings", summary['total_buildings'])
@@ -217,21 +457,21 @@ with tab1:
         col1, col2 = st.columns(2)
         
         with col1:
-            if os.path.exists(f"{PLOTS_PATH}/consumption_distribution.png"):
-                st.image(f"{PLOTS_PATH}/consumption_distribution.png", use_column_width=True)
+            if "consumption_distribution.png" in plot_files:
+                st.image(load_plot("consumption_distribution.png"), use_column_width=True)
                 st.caption("Consumption Distribution")
             
-            if os.path.exists(f"{PLOTS_PATH}/weekend_vs_weekday.png"):
-                st.image(f"{PLOTS_PATH}/weekend_vs_weekday.png", use_column_width=True)
+            if "weekend_vs_weekday.png" in plot_files:
+                st.image(load_plot("weekend_vs_weekday.png"), use_column_width=True)
                 st.caption("Weekend vs Weekday Patterns")
         
         with col2:
-            if os.path.exists(f"{PLOTS_PATH}/consumption_by_type.png"):
-                st.image(f"{PLOTS_PATH}/consumption_by_type.png", use_column_width=True)
+            if "consumption_by_type.png" in plot_files:
+                st.image(load_plot("consumption_by_type.png"), use_column_width=True)
                 st.caption("Consumption by Building Type")
             
-            if os.path.exists(f"{PLOTS_PATH}/correlation_heatmap.png"):
-                st.image(f"{PLOTS_PATH}/correlation_heatmap.png", use_column_width=True)
+            if "correlation_heatmap.png" in plot_files:
+                st.image(load_plot("correlation_heatmap.png"), use_column_width=True)
                 st.caption("Feature Correlations")
     else:
         st.info(f"Plots folder not found at `{PLOTS_PATH}/`. Add a plots/ folder with EDA images.")
@@ -258,30 +498,23 @@ with tab2:
     st.header("Cluster Analysis")
     st.caption("Buildings grouped by consumption patterns using K-Means clustering")
     
-    # Get cluster details
-    cluster_stats = {}
-    for cluster_id in summary['clusters'].keys():
-        cluster_data = get_cluster(int(cluster_id))
-        if cluster_data:
-            cluster_stats[cluster_id] = cluster_data
-    
     # Display each cluster
-    cols = st.columns(len(summary['clusters']))
+    cluster_cards = get_cluster_cards(version)
+    cols = st.columns(len(cluster_cards))
     
-    for i, (cluster_id, count) in enumerate(summary['clusters'].items()):
-        with cols[i]:
-            stats = cluster_stats.get(cluster_id, {})
-            desc = get_cluster_description(int(cluster_id), cluster_stats)
+    for col, card in zip(cols, cluster_cards):
+        with col:
+            stats = card["stats"]
             
-            st.subheader(desc["name"])
-            st.metric("Buildings", count)
+            st.subheader(card["name"])
+            st.metric("Buildings", card["count"])
             
             if stats:
                 st.write(f"**Avg Baseload:** {stats.get('avg_baseload', 0):.1f} kWh")
                 st.write(f"**Avg Weekend Ratio:** {stats.get('avg_weekend_ratio', 0):.2f}")
             
-            st.write(desc["description"])
-            st.info(desc["action"])
+            st.write(card["description"])
+            st.info(card["action"])
     
     st.markdown("---")
     
@@ -292,7 +525,7 @@ with tab2:
     st.caption("These buildings have the highest combination of anomaly flags, efficiency gaps, and baseload.")
     
     priority_buildings = summary['top_priority']
-    priority_df = pd.DataFrame(priority_buildings)
+    priority_df = get_priority_table(version)
     
     # Center the dataframe
     col1, col2, col3 = st.columns([1, 3, 1])
@@ -304,92 +537,7 @@ with tab2:
     st.header("Building Deep Dive")
     st.caption("Select a building to understand why it was flagged")
     
-    if priority_buildings:
-        building_options = {
-            f"#{b['priority_rank']} - {b['building_id']} ({b['building_type']})": b['building_id'] 
-            for b in priority_buildings
-        }
-        
-        selected = st.selectbox(
-            "Select a priority building:",
-            options=list(building_options.keys())
-        )
-        
-        if selected:
-            building_id = building_options[selected]
-            building = get_building(building_id)
-            
-            if building:
-                st.markdown("---")
-                
-                # Recommendation as the main callout
-                recommendation = building.get('recommendation', 'Conduct energy audit to identify optimization opportunities.')
-                st.success(f"**Recommendation:** {recommendation}")
-                
-                # Get cluster data for comparison
-                cluster_id = building.get('cluster')
-                cluster_data = get_cluster(int(cluster_id)) if cluster_id is not None else None
-                weekend_ratio = building.get('weekend_ratio')
-                
-                # Building vs Cluster Comparison
-                st.subheader("How does this building compare to its peers?")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**This Building**")
-                    st.metric("Avg Consumption", f"{building.get('avg_consumption', 0):.1f} kWh")
-                    st.metric("Baseload", f"{building.get('baseload', 0):.1f} kWh")
-                    if weekend_ratio:
-                        st.metric("Weekend Ratio", f"{weekend_ratio:.2f}")
-                
-                with col2:
-                    st.write(f"**Cluster {cluster_id} Average**")
-                    if cluster_data:
-                        st.metric("Avg Consumption", f"{cluster_data.get('avg_baseload', 0):.1f} kWh", 
-                                  delta=f"{building.get('avg_consumption', 0) - cluster_data.get('avg_baseload', 0):.1f}")
-                        st.metric("Baseload", f"{cluster_data.get('avg_baseload', 0):.1f} kWh",
-                                  delta=f"{building.get('baseload', 0) - cluster_data.get('avg_baseload', 0):.1f}")
-                        if cluster_data.get('avg_weekend_ratio'):
-                            st.metric("Weekend Ratio", f"{cluster_data.get('avg_weekend_ratio', 0):.2f}",
-                                      delta=f"{(weekend_ratio or 0) - cluster_data.get('avg_weekend_ratio', 0):.2f}")
-                    else:
-                        st.write("Cluster data not available")
-                
-                # SHAP Explanation
-                shap_values = building.get('shap_values', {})
-                
-                if shap_values:
-                    st.markdown("---")
-                    st.subheader("Why was this building flagged?")
-                    st.caption("The chart below shows which factors contributed most to the model's prediction. Longer bars = bigger impact.")
-                    
-                    sorted_shap = sorted(shap_values.items(), key=lambda x: abs(x[1]), reverse=True)
-                    features = [x[0].replace('_', ' ').title() for x in sorted_shap]
-                    values = [x[1] for x in sorted_shap]
-                    colors = ['#ef4444' if v > 0 else '#22c55e' for v in values]
-                    
-                    fig = go.Figure(go.Bar(
-                        x=values,
-                        y=features,
-                        orientation='h',
-                        marker_color=colors
-                    ))
-                    fig.update_layout(
-                        xaxis_title="Impact on prediction",
-                        yaxis_title="",
-                        height=max(300, len(features) * 35),
-                        margin=dict(l=10, r=10, t=10, b=40),
-                        yaxis=dict(autorange="reversed"),
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                    )
-                    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='#e2e8f0')
-                    fig.update_yaxes(showgrid=False)
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    st.caption("🔴 Red = pushes toward worse efficiency | 🟢 Green = pushes toward better efficiency")
+    deep_dive(priority_buildings, version)
 
 # -----------------------------------------------------------------------------
 # Footer